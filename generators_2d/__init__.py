@@ -0,0 +1,109 @@
+"""
+The pure Python generators are imported directly, they only depend on the standard library.
+Everything that needs NumPy (or matplotlib) is imported lazily on first attribute access, so 'import generators_2d' stays fast.
+NumPy and matplotlib are optional, they are installed with the "numpy" and "plot" extras.
+"""
+import importlib
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from generators_2d.generators import (
+    generate_2d_ordered_grid_points,
+    generate_2d_grid_points,
+    generate_2d_line,
+    generate_2d_circle_points,
+    indices_generator,
+)
+
+# Function name -> module which is imported once the function is first accessed
+_LAZY_FUNCTIONS: Dict[str, str] = {
+    "generate_2d_ordered_grid_points_array": "generators_2d.numpy_backend",
+    "generate_2d_grid_points_array": "generators_2d.numpy_backend",
+    "generate_2d_line_array": "generators_2d.numpy_backend",
+    "generate_2d_circle_points_array": "generators_2d.numpy_backend",
+    "export_points": "generators_2d.export",
+    "load_points": "generators_2d.export",
+    "color_ramp": "generators_2d.visualize",
+    "render_squares": "generators_2d.visualize",
+    "render_line": "generators_2d.visualize",
+    "render_circles": "generators_2d.visualize",
+    "save_image": "generators_2d.visualize",
+}
+
+# Generator name -> backend name -> name of the function implementing the generator on that backend
+BACKENDS: Dict[str, Dict[str, str]] = {
+    name: {"python": name, "numpy": f"{name}_array"}
+    for name in [
+        "generate_2d_ordered_grid_points",
+        "generate_2d_grid_points",
+        "generate_2d_line",
+        "generate_2d_circle_points",
+    ]
+}
+
+# Function name -> optional third party packages the function needs, for all functions that are imported lazily
+DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    **{name: ("numpy",) for name in _LAZY_FUNCTIONS},
+    "save_image": ("numpy", "matplotlib"),
+}
+
+__all__: List[str] = [
+    "BACKENDS",
+    "DEPENDENCIES",
+    "get_backend",
+    "get_generator",
+    "generate_2d_ordered_grid_points",
+    "generate_2d_grid_points",
+    "generate_2d_line",
+    "generate_2d_circle_points",
+    "indices_generator",
+    *_LAZY_FUNCTIONS,
+]
+
+
+def get_backend(function: Union[str, Callable]) -> str:
+    """
+    Returns the backend ("python" or "numpy") of a generator function or its array version, which can be given by name or as the function itself.
+    Does not import the function if it is given by name.
+    """
+    name = function if isinstance(function, str) else function.__name__
+    for backends in BACKENDS.values():
+        for backend, function_name in backends.items():
+            if function_name == name:
+                return backend
+    raise ValueError(f"{name} is not a generator function or its array version")
+
+
+def get_generator(name: str, backend: str = "python") -> Callable:
+    """
+    Returns the implementation of a generator for the given backend, e.g.
+    get_generator("generate_2d_line", "numpy") returns generate_2d_line_array
+
+    The "python" functions yield tuples, the "numpy" functions return the same values at once as np.ndarray with one row per tuple.
+    Raises ImportError if the backend is "numpy" but numpy is not installed.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown generator {name}, expected one of {sorted(BACKENDS)}")
+    if backend not in BACKENDS[name]:
+        raise ValueError(f"Unknown backend {backend}, expected one of {sorted(BACKENDS[name])}")
+    function_name = BACKENDS[name][backend]
+    return globals()[function_name] if function_name in globals() else __getattr__(function_name)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_FUNCTIONS:
+        try:
+            module = importlib.import_module(_LAZY_FUNCTIONS[name])
+        except ModuleNotFoundError as e:
+            if e.name != "numpy":
+                raise
+            raise ImportError(f'{name} needs numpy, install the "numpy" extra or use the "python" backend') from e
+        value = getattr(module, name)
+        # Cache the function in the package namespace so __getattr__ is only called once
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    # Only the public API, not the names imported for the implementation
+    return sorted({name for name in globals() if name.startswith("__")} | set(__all__))
@@ -0,0 +1,286 @@
+import os
+import sys
+import json
+import argparse
+import secrets
+import itertools
+import contextlib
+from typing import IO, Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from generators_2d.generators import (
+    generate_2d_ordered_grid_points,
+    generate_2d_grid_points,
+    generate_2d_line,
+    generate_2d_circle_points,
+)
+
+# Magic bytes at the start of every raw binary export, followed by the header length and a json header
+RAW_MAGIC = b"GEN2D\x01"
+# The raw header is padded with spaces to a multiple of this, so the data section stays aligned for memory mapping
+HEADER_ALIGNMENT = 64
+DEFAULT_CHUNK_SIZE = 2 ** 16
+
+# Generator name -> (generator function, names of the yielded columns, default dtype)
+GENERATORS: Dict[str, Tuple[Callable[..., Generator[tuple, None, None]], Tuple[str, ...], str]] = {
+    "ordered_grid": (generate_2d_ordered_grid_points, ("distance_squared", "x", "y"), "int64"),
+    "grid": (generate_2d_grid_points, ("x", "y"), "int64"),
+    "line": (generate_2d_line, ("x", "y"), "int64"),
+    "circle": (generate_2d_circle_points, ("amount_of_points", "angle", "x", "y"), "float64"),
+}
+
+
+def _iter_chunks(points: Iterable[tuple], chunk_size: int) -> Generator[List[tuple], None, None]:
+    """ Splits an iterable into lists of at most chunk_size elements """
+    iterator = iter(points)
+    while 1:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _pad_header(header: bytes, prefix_length: int) -> bytes:
+    """ Pads the header with spaces and a newline so that prefix_length + len(header) is a multiple of HEADER_ALIGNMENT """
+    total = prefix_length + len(header) + 1
+    padding = -total % HEADER_ALIGNMENT
+    return header + b" " * padding + b"\n"
+
+
+def _npy_header(dtype: np.dtype, count: int, columns: int) -> bytes:
+    """
+    Creates a .npy version 1.0 header.
+    The header dict is padded to a fixed size so that it can be rewritten in place once the final row count is known.
+    """
+    header_dict = {"descr": np.lib.format.dtype_to_descr(dtype), "fortran_order": False, "shape": (count, columns)}
+    header = repr(header_dict).encode("latin1")
+    # Reserve room for the largest possible row count, so rewriting never changes the header length
+    header = header.ljust(len(header) + 20 - len(str(count)))
+    prefix = b"\x93NUMPY\x01\x00"
+    header = _pad_header(header, len(prefix) + 2)
+    return prefix + len(header).to_bytes(2, "little") + header
+
+
+def _raw_header(parameters: Dict[str, Any], count: int) -> bytes:
+    """
+    Creates the header of a raw binary export: magic bytes, header length (4 bytes little endian) and a json dict.
+    Like the .npy header, it is padded to a fixed size so that the row count can be rewritten in place.
+    """
+    header = json.dumps(dict(parameters, count=count), sort_keys=True).encode("utf-8")
+    header = header.ljust(len(header) + 20 - len(str(count)))
+    header = _pad_header(header, len(RAW_MAGIC) + 4)
+    return RAW_MAGIC + len(header).to_bytes(4, "little") + header
+
+
+def _sidecar_path(path: str) -> str:
+    return path + ".json"
+
+
+def _cast_chunk(chunk: np.ndarray, dtype: np.dtype) -> np.ndarray:
+    """
+    Casts the chunk to dtype, raises ValueError if that would change any value.
+    Only float to smaller float casts may round, as long as no finite value overflows.
+    Old numpy versions wrap integers silently when casting, so the result is compared with the chunk instead of relying on an error.
+    """
+    if np.can_cast(chunk.dtype, dtype):
+        return chunk.astype(dtype)
+    with np.errstate(over="ignore", invalid="ignore"):
+        cast = chunk.astype(dtype)
+    if chunk.dtype.kind == "f" and dtype.kind == "f":
+        if np.isfinite(cast[np.isfinite(chunk)]).all():
+            return cast
+    elif np.array_equal(cast, chunk):
+        return cast
+    raise ValueError(f"Points can not be stored as {dtype} without changing their values, use a larger dtype")
+
+
+@contextlib.contextmanager
+def _temporary_file(path: str, mode: str) -> Generator[Tuple[IO, str], None, None]:
+    """
+    Opens a temporary file in the directory of path, and removes it again if an exception is raised while writing it.
+
+    Returnvalues:
+    (file: IO, temporary_path: str)
+    """
+    directory, file_name = os.path.split(os.path.abspath(path))
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    while 1:
+        temporary_path = os.path.join(directory, f".{file_name}.{secrets.token_hex(8)}.tmp")
+        try:
+            # Unlike mkstemp (mode 0o600), this gets the same permissions as a file created with open()
+            fd = os.open(temporary_path, flags, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f, temporary_path
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+def _remove_files(*paths: Optional[str]):
+    """ Removes the files if they exist, None is ignored """
+    for path in paths:
+        if path is None:
+            continue
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+def export_points(
+    path: str,
+    generator_name: str,
+    generator_kwargs: Dict[str, Any],
+    dtype: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> int:
+    """
+    Streams the points of one of the generators in GENERATORS to a file, chunk_size rows at a time, so that the whole point set is never held in memory.
+
+    If path ends with ".npy", a standard .npy file is written which can be loaded with np.load, and the generator parameters are written next to it to "<path>.json".
+    Otherwise a raw binary file is written, starting with a small json header containing the parameters, followed by the rows in C order.
+    Both can be memory mapped with load_points.
+
+    Returnvalues:
+    amount_of_rows_written: int
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size has to be at least 1, got {chunk_size}")
+    generator_function, column_names, default_dtype = GENERATORS[generator_name]
+    np_dtype = np.dtype(dtype or default_dtype)
+    parameters = {
+        "generator": generator_name,
+        "kwargs": generator_kwargs,
+        "columns": list(column_names),
+        "dtype": np_dtype.str,
+    }
+    is_npy = path.endswith(".npy")
+
+    def make_header(count: int) -> bytes:
+        if is_npy:
+            return _npy_header(np_dtype, count, len(column_names))
+        return _raw_header(parameters, count)
+
+    # Write to temporary files first, so that a failing generator or dtype cast never leaves a truncated file at path
+    count = 0
+    with _temporary_file(path, "wb") as (f, temporary_path):
+        header_length = len(make_header(count))
+        f.write(make_header(count))
+        for chunk in _iter_chunks(generator_function(**generator_kwargs), chunk_size):
+            # Create the chunk in the default dtype first, so values which do not fit into np_dtype can be detected
+            f.write(_cast_chunk(np.array(chunk, dtype=default_dtype), np_dtype).tobytes())
+            count += len(chunk)
+        # Rewrite the header with the final amount of rows
+        f.seek(0)
+        header = make_header(count)
+        assert len(header) == header_length, "Header length changed while exporting"
+        f.write(header)
+
+    temporary_sidecar_path = None
+    try:
+        if is_npy:
+            with _temporary_file(_sidecar_path(path), "w") as (f, temporary_sidecar_path):
+                json.dump(dict(parameters, count=count), f, sort_keys=True)
+        # Replace the data first, so a new sidecar is never next to an old data file
+        os.replace(temporary_path, path)
+        if temporary_sidecar_path is not None:
+            os.replace(temporary_sidecar_path, _sidecar_path(path))
+    except BaseException:
+        _remove_files(temporary_path, temporary_sidecar_path)
+        raise
+    return count
+
+
+def load_points(path: str) -> Tuple[Dict[str, Any], np.ndarray]:
+    """
+    Loads a file written by export_points as read-only memory map, so that many processes can share the same page-cached copy.
+    A .npy file without a matching "<path>.json" is loaded as well, its parameters then only contain "count" and "dtype".
+
+    Returnvalues:
+    (parameters: dict, points: np.ndarray with shape (count, columns))
+    """
+    if path.endswith(".npy"):
+        try:
+            # Empty arrays can not be memory mapped
+            points = np.load(path, mmap_mode="r")
+        except ValueError:
+            points = np.load(path)
+        parameters = None
+        if os.path.exists(_sidecar_path(path)):
+            with open(_sidecar_path(path)) as f:
+                parameters = json.load(f)
+        if parameters is None or parameters["count"] != points.shape[0]:
+            # Any other .npy file, or the sidecar of the previous export has not been replaced yet, the parameters are unknown
+            parameters = {"count": points.shape[0], "dtype": points.dtype.str}
+        return parameters, points
+
+    with open(path, "rb") as f:
+        magic = f.read(len(RAW_MAGIC))
+        if magic != RAW_MAGIC:
+            raise ValueError(f"{path} is not a raw generators_2d export")
+        header_length = int.from_bytes(f.read(4), "little")
+        parameters = json.loads(f.read(header_length).decode("utf-8"))
+    offset = len(RAW_MAGIC) + 4 + header_length
+    shape = (parameters["count"], len(parameters["columns"]))
+    if not parameters["count"]:
+        return parameters, np.empty(shape, dtype=parameters["dtype"])
+    return parameters, np.memmap(path, dtype=parameters["dtype"], mode="r", offset=offset, shape=shape)
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer")
+    return number
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="generators-2d-export",
+        description="Streams generated 2d points to a .npy or raw binary file which can be memory mapped with generators_2d.export.load_points",
+    )
+    parser.add_argument("--dtype", default=None, help="numpy dtype of the output, defaults to a dtype fitting the generator")
+    parser.add_argument("--chunk-size", type=_positive_int, default=DEFAULT_CHUNK_SIZE, help="amount of rows written at once")
+    subparsers = parser.add_subparsers(dest="generator", required=True)
+
+    ordered_grid = subparsers.add_parser("ordered_grid", help="generate_2d_ordered_grid_points")
+    ordered_grid.add_argument("output")
+    ordered_grid.add_argument("--limit", type=int, required=True)
+
+    grid = subparsers.add_parser("grid", help="generate_2d_grid_points")
+    grid.add_argument("output")
+    grid.add_argument("--min-distance", type=int, default=0)
+    grid.add_argument("--max-distance", type=int, default=1)
+    grid.add_argument("--step-size", type=int, default=1)
+
+    line = subparsers.add_parser("line", help="generate_2d_line")
+    line.add_argument("output")
+    for name in ["x0", "y0", "x1", "y1"]:
+        line.add_argument(name, type=int)
+    line.add_argument("--exclude-start", action="store_true")
+    line.add_argument("--exclude-end", action="store_true")
+
+    circle = subparsers.add_parser("circle", help="generate_2d_circle_points")
+    circle.add_argument("output")
+    circle.add_argument("--point-radius", type=float, default=1.0)
+    circle.add_argument("--circle-radius", type=float, default=1.0)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = vars(_create_parser().parse_args(argv))
+    generator_name = args.pop("generator")
+    output = args.pop("output")
+    dtype = args.pop("dtype")
+    chunk_size = args.pop("chunk_size")
+    # The remaining arguments are the keyword arguments of the generator function
+    count = export_points(output, generator_name, args, dtype=dtype, chunk_size=chunk_size)
+    print(f"Wrote {count} points to {os.path.abspath(output)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
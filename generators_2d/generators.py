@@ -1,7 +1,5 @@
-import time
 import math
 import cmath
-import itertools
 from typing import Generator, Tuple, Set, List
 import heapq
 
@@ -251,154 +249,6 @@ def indices_generator(start_list: List[int], end_list: List[int]) -> Generator[L
 
 
 if __name__ == "__main__":
-    import matplotlib.pyplot as plt
-
-    def plot_squares(limit: int):
-        fig, ax = plt.subplots()
-
-        point_positions = []
-
-        # Set the ranges of x and y axis
-        xmin, ymin = -limit - 0.5, -limit - 0.5
-        xmax, ymax = limit + 0.5, limit + 0.5
-        ax.set(xlim=(xmin, xmax), ylim=(ymin, ymax))
-
-        # Aspect ratio of 1:1 for x and y axis, don't stretch one axis
-        ax.set_aspect(1.0)
-
-        # Show vertical and horizontal line at (0, 0)
-        ax.axhline(y=0, color="k")
-        ax.axvline(x=0, color="k")
-
-        for dist, x, y in generate_2d_ordered_grid_points(limit):
-            point_positions.append((dist, x, y))
-
-        colors = list(_get_colors_hex(len(point_positions)))
-        # colors.sort()
-        colors.sort(key=lambda c: c[0] ** 2 + c[1] ** 2 + c[2] ** 2, reverse=True)
-        # colors.sort(key=lambda c: c[0] + c[1] + c[2], reverse=True)
-        # colors.sort(key=lambda c: c[0] * c[1] * c[2], reverse=True)
-
-        for (dist, x, y), color in zip(point_positions, colors):
-            # print(dist, x, y)
-            r, g, b = color
-            hex_string = "#" + hex(r)[2:].zfill(2) + hex(g)[2:].zfill(2) + hex(b)[2:].zfill(2)
-            square = plt.Rectangle((x - 0.5, y - 0.5), width=1, height=1, color=hex_string)
-            ax.add_artist(square)
-
-        if point_positions:
-            fig.savefig(f"plot_square.png", dpi=1000)
-
-    def plot_line(start: Tuple[int, int], end: Tuple[int, int]):
-        fig, ax = plt.subplots()
-
-        point_positions = []
-
-        # Set the ranges of x and y axis
-        xmin, ymin = start
-        xmax, ymax = end
-        ax.set(xlim=(xmin - 0.5, xmax + 0.5), ylim=(ymin - 0.5, ymax + 0.5))
-
-        # Aspect ratio of 1:1 for x and y axis, don't stretch one axis
-        ax.set_aspect(1.0)
-
-        # Show vertical and horizontal line at (0, 0)
-        ax.axhline(y=0, color="k")
-        ax.axvline(x=0, color="k")
-
-        for x, y in generate_2d_line(*start, *end):
-            point_positions.append((x, y))
-
-        for (x, y), color in zip(point_positions, _get_colors_hex(len(point_positions))):
-            r, g, b = color
-            hex_string = "#" + hex(r)[2:].zfill(2) + hex(g)[2:].zfill(2) + hex(b)[2:].zfill(2)
-            square = plt.Rectangle((x - 0.5, y - 0.5), width=1, height=1, color=hex_string)
-            ax.add_artist(square)
-
-        if point_positions:
-            fig.savefig(f"plot_line.png", dpi=1000)
-
-    def plot_circles(fill_circle: bool = False):
-        # Set the radius of each point on the circle, and the circle radius
-        limit = 100
-        for point_radius in range(1, 10):
-            fig, ax = plt.subplots()
-
-            circle_positions = []
-
-            if fill_circle:
-                # Draw the center point
-                circle_positions.append((0, 0))
-
-            # Set the ranges of x and y axis
-            xmin = ymin = -limit - point_radius
-            xmax = ymax = limit + point_radius
-            ax.set(xlim=(xmin, xmax), ylim=(ymin, ymax))
-
-            # Aspect ratio of 1:1 for x and y axis, don't stretch one axis
-            ax.set_aspect(1.0)
-
-            # Hide axes
-            # ax.get_xaxis().set_visible(False)
-            # ax.get_yaxis().set_visible(False)
-
-            # Show vertical and horizontal line at (0, 0)
-            ax.axhline(y=0, color="k")
-            ax.axvline(x=0, color="k")
-
-            circles_added = 0
-
-            for circle_radius in itertools.count(start=point_radius * 2, step=point_radius * 2):
-                if circle_radius >= limit:
-                    break
-
-                if not fill_circle:
-                    # Comment this out if you want to fill points inside the circle
-                    if circle_radius < limit - point_radius * 2:
-                        continue
-
-                for amount, angle, x, y in generate_2d_circle_points(
-                    point_radius=point_radius, circle_radius=circle_radius
-                ):
-                    circle_positions.append((x, y))
-                    circles_added += 1
-
-            circle_positions.sort(key=lambda p: (round(p[0] ** 2 + p[1] ** 2, 3), p[0], p[1]), reverse=True)
-
-            colors = list(_get_colors_hex(len(circle_positions)))
-            # Sort by bright colors inside, dark colors outside
-            # colors.sort(key=lambda c: c[0] + c[1] + c[2])
-            # colors.sort(key=lambda c: c[0] * c[1] * c[2])
-            # Sort by red colors inside, green colors outside
-            colors.sort()
-
-            # Draw circles
-            for (x, y), color in zip(circle_positions, colors):
-                r, g, b = color
-                hex_string = "#" + hex(r)[2:].zfill(2) + hex(g)[2:].zfill(2) + hex(b)[2:].zfill(2)
-                circle1 = plt.Circle((x, y), point_radius, color=hex_string, antialiased=True)
-                ax.add_artist(circle1)
-
-            # Check if the circles are too close to each other or only if the output .png file has those overlaps
-            # for x0, y0 in circle_positions:
-            #     for x1, y1 in circle_positions:
-            #         if x0 == x1 and y0 == y1:
-            #             continue
-            #         dist = math.hypot(x0-x1, y0-y1)
-            #         if dist + 10e-8 < point_radius * 2:
-            #             print(f"({x0}, {y0}) and ({x1}, {y1}) have distance {dist} but should only have distance {point_radius * 2}")
-
-            # fig.show()
-            if circles_added:
-                fig.savefig(f"plot_circles-{point_radius:02}-{limit:02}.png", dpi=100)
-
-    # t0 = time.perf_counter()
-    # plot_squares(limit=5)
-    # plot_line(start=(0, 0), end=(40, 30))
-    # plot_circles(fill_circle=True)
-    # t1 = time.perf_counter()
-    # print(t1 - t0)
-
     def test_indices_generator():
         for index in indices_generator([0, 1, 0], [2, 3, 2]):
             print(index)
@@ -0,0 +1,160 @@
+"""
+NumPy versions of the generators in generators.py.
+Instead of yielding tuples, each function returns the complete result at once as array with one row per tuple, in the same order as the generator.
+"""
+import math
+
+import numpy as np
+
+
+def generate_2d_ordered_grid_points_array(limit: int) -> np.ndarray:
+    """
+    Array version of generate_2d_ordered_grid_points.
+
+    The generator pops the points (distance_squared, x, y) with x >= y >= 0 from a heap, so they are ordered by (distance_squared, x, y), and yields their mirrors right after them. It stops at the first point with x > limit, which is ((limit+1)**2, limit+1, 0).
+
+    Returnvalues:
+    np.ndarray of dtype int64 with shape (amount, 3) containing (distance_squared, x, y)
+    """
+    x, y = np.tril_indices(limit + 1)
+    # tril_indices returns (row, column) with row >= column
+    x, y = x.astype(np.int64), y.astype(np.int64)
+    dist = x ** 2 + y ** 2
+    keep = dist <= (limit + 1) ** 2
+    x, y, dist = x[keep], y[keep], dist[keep]
+    order = np.lexsort((y, x, dist))
+    x, y, dist = x[order], y[order], dist[order]
+
+    # The 8 mirrors in the order in which the generator yields them
+    mirrors = np.stack(
+        [
+            np.stack([x, y], axis=1),
+            np.stack([-x, -y], axis=1),
+            np.stack([x, -y], axis=1),
+            np.stack([-x, y], axis=1),
+            np.stack([y, x], axis=1),
+            np.stack([-y, -x], axis=1),
+            np.stack([y, -x], axis=1),
+            np.stack([-y, x], axis=1),
+        ],
+        axis=1,
+    )
+    not_origin = x != 0
+    y_not_zero = not_origin & (y != 0)
+    not_diagonal = not_origin & (x != y)
+    valid = np.stack(
+        [
+            np.ones_like(not_origin),
+            not_origin,
+            y_not_zero,
+            y_not_zero,
+            not_diagonal,
+            not_diagonal,
+            not_diagonal & y_not_zero,
+            not_diagonal & y_not_zero,
+        ],
+        axis=1,
+    )
+    result = np.empty((int(valid.sum()), 3), dtype=np.int64)
+    result[:, 0] = np.repeat(dist, valid.sum(axis=1))
+    result[:, 1:] = mirrors[valid]
+    return result
+
+
+def generate_2d_grid_points_array(min_distance: int = 0, max_distance: int = 1, step_size: int = 1) -> np.ndarray:
+    """
+    Array version of generate_2d_grid_points.
+
+    Returnvalues:
+    np.ndarray of dtype int64 with shape (amount, 2) containing (x, y)
+    """
+    parts = []
+    if min_distance == 0:
+        parts.append(np.zeros((1, 2), dtype=np.int64))
+    for dist in range(min_distance, max_distance + 1, step_size):
+        if dist == 0:
+            continue
+        xs = np.arange(-dist, dist + 1, step_size, dtype=np.int64)
+        # Top row and bottom row, alternating
+        rows = np.empty((len(xs) * 2, 2), dtype=np.int64)
+        rows[:, 0] = np.repeat(xs, 2)
+        rows[0::2, 1] = dist
+        rows[1::2, 1] = -dist
+        ys = np.arange(-dist + 1, dist, step_size, dtype=np.int64)
+        # Right column and left column, alternating
+        columns = np.empty((len(ys) * 2, 2), dtype=np.int64)
+        columns[0::2, 0] = dist
+        columns[1::2, 0] = -dist
+        columns[:, 1] = np.repeat(ys, 2)
+        parts.append(rows)
+        parts.append(columns)
+    if not parts:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.concatenate(parts)
+
+
+def generate_2d_line_array(
+    x0: int, y0: int, x1: int, y1: int, exclude_start: bool = False, exclude_end: bool = False
+) -> np.ndarray:
+    """
+    Array version of generate_2d_line.
+    np.add.accumulate adds the slope one step after another like the generator, so the rounding is identical.
+
+    Returnvalues:
+    np.ndarray of dtype int64 with shape (amount, 2) containing (x, y)
+    """
+    if x0 == x1 and y0 == y1:
+        if not (exclude_start or exclude_end):
+            return np.array([[x0, y0]], dtype=np.int64)
+        return np.empty((0, 2), dtype=np.int64)
+    x_diff = abs(x1 - x0)
+    y_diff = abs(y1 - y0)
+
+    start_offset = 1 if exclude_start else 0
+    end_offset = 1 if exclude_end else 0
+
+    # The axis along which the line advances by exactly 1 per point
+    if y_diff <= x_diff:
+        main_start, main_end, other_start, slope = x0, x1, y0, (y1 - y0) / x_diff
+    else:
+        main_start, main_end, other_start, slope = y0, y1, x0, (x1 - x0) / y_diff
+    if main_end > main_start:
+        main = np.arange(main_start + start_offset, main_end + 1 - end_offset, dtype=np.int64)
+    else:
+        main = np.arange(main_start - start_offset, main_end - 1 + end_offset, -1, dtype=np.int64)
+
+    steps = np.full(len(main), slope, dtype=np.float64)
+    if len(steps):
+        steps[0] = other_start
+    other = np.floor(np.add.accumulate(steps)).astype(np.int64)
+
+    result = np.empty((len(main), 2), dtype=np.int64)
+    if y_diff <= x_diff:
+        result[:, 0], result[:, 1] = main, other
+    else:
+        result[:, 0], result[:, 1] = other, main
+    return result
+
+
+def generate_2d_circle_points_array(point_radius: float = 1.0, circle_radius: float = 1.0) -> np.ndarray:
+    """
+    Array version of generate_2d_circle_points.
+    The x and y values may differ from the generator in the last bit, because np.cos and np.sin are used instead of cmath.rect.
+
+    Returnvalues:
+    np.ndarray of dtype float64 with shape (amount, 4) containing (amount_of_points, current_angle_on_circle, x, y)
+    """
+    if point_radius * 2 > circle_radius:
+        return np.empty((0, 4), dtype=np.float64)
+
+    amount_of_points_on_circle = math.pi / (2 * math.asin(point_radius / (2 * circle_radius)))
+    amount_of_points_on_circle_rounded = math.floor(amount_of_points_on_circle)
+    angle_per_point = (2 * math.pi) / amount_of_points_on_circle_rounded
+
+    angles = np.arange(amount_of_points_on_circle_rounded) * angle_per_point
+    result = np.empty((amount_of_points_on_circle_rounded, 4), dtype=np.float64)
+    result[:, 0] = amount_of_points_on_circle
+    result[:, 1] = angles
+    result[:, 2] = circle_radius * np.cos(angles)
+    result[:, 3] = circle_radius * np.sin(angles)
+    return result
@@ -0,0 +1,247 @@
+import itertools
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+from generators_2d.generators import generate_2d_ordered_grid_points, generate_2d_line, generate_2d_circle_points
+
+# (xmin, xmax, ymin, ymax) in generator coordinates
+Extent = Tuple[float, float, float, float]
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+# Amount of stamp pixels that are drawn at once in render_disks, limits the memory of the temporary index arrays and keeps them in cache
+PIXEL_BUDGET = 2 ** 16
+
+
+def points_to_array(points: Iterable[tuple], columns: int, dtype: str = "float64") -> np.ndarray:
+    """
+    Converts the tuples yielded by a generator to an array with shape (amount, columns) without creating a list of tuples first.
+    """
+    flat = np.fromiter(itertools.chain.from_iterable(points), dtype=dtype)
+    return flat.reshape(-1, columns)
+
+
+def color_ramp(amount: int) -> np.ndarray:
+    """
+    Vectorized version of _get_colors_hex: spreads 'amount' colors evenly over all 256**3 colors.
+
+    Returnvalues:
+    np.ndarray of dtype uint8 with shape (amount, 3) containing (r, g, b)
+    """
+    limit = 256 ** 3 - 1
+    assert amount < limit, "Too many points!"
+    color_numbers = np.arange(amount, dtype=np.int64) * (limit // max(amount, 1))
+    colors = np.empty((amount, 3), dtype=np.uint8)
+    colors[:, 0] = color_numbers % 256
+    colors[:, 1] = color_numbers // 256 % 256
+    colors[:, 2] = color_numbers // 256 ** 2 % 256
+    return colors
+
+
+def _new_image(width: int, height: int, background: Tuple[int, int, int]) -> np.ndarray:
+    image = np.empty((height, width, 3), dtype=np.uint8)
+    image[:] = background
+    return image
+
+
+def _draw_axes(image: np.ndarray, row: int, column: int, color: Tuple[int, int, int] = BLACK):
+    """ Draws a horizontal line at 'row' and a vertical line at 'column' if they are inside the image """
+    height, width, _ = image.shape
+    if 0 <= row < height:
+        image[row, :] = color
+    if 0 <= column < width:
+        image[:, column] = color
+
+
+def render_cells(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    colors: np.ndarray,
+    extent: Extent,
+    scale: int = 1,
+    background: Tuple[int, int, int] = WHITE,
+    draw_axes: bool = True,
+) -> np.ndarray:
+    """
+    Renders integer grid points as squares of size 1x1 into an RGB image, each square is 'scale' pixels wide.
+    Points that are drawn later are drawn on top of earlier points.
+    The first row of the image is the top (ymax) of the extent.
+
+    Returnvalues:
+    np.ndarray of dtype uint8 with shape (height, width, 3)
+    """
+    xmin, xmax, ymin, ymax = (int(value) for value in extent)
+    cells = _new_image(xmax - xmin + 1, ymax - ymin + 1, background)
+    columns = np.asarray(xs, dtype=np.int64) - xmin
+    rows = ymax - np.asarray(ys, dtype=np.int64)
+    inside = (columns >= 0) & (columns < cells.shape[1]) & (rows >= 0) & (rows < cells.shape[0])
+    cells[rows[inside], columns[inside]] = colors[inside]
+
+    image = cells.repeat(scale, axis=0).repeat(scale, axis=1) if scale > 1 else cells
+    if draw_axes:
+        # Draw the axes through the center of the (0, 0) cell
+        _draw_axes(image, ymax * scale + scale // 2, -xmin * scale + scale // 2)
+    return image
+
+
+def disk_stamp(radius_pixels: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the pixel offsets (row_offsets, column_offsets) of a filled disk, relative to the center pixel.
+    """
+    r = int(np.ceil(radius_pixels))
+    row_offsets, column_offsets = np.mgrid[-r : r + 1, -r : r + 1]
+    mask = row_offsets ** 2 + column_offsets ** 2 <= radius_pixels ** 2
+    return row_offsets[mask], column_offsets[mask]
+
+
+def render_disks(
+    xs: np.ndarray,
+    ys: np.ndarray,
+    radius: float,
+    colors: np.ndarray,
+    extent: Extent,
+    pixels_per_unit: float = 1.0,
+    background: Tuple[int, int, int] = WHITE,
+    draw_axes: bool = True,
+) -> np.ndarray:
+    """
+    Renders disks with the given radius around the (float) centers into an RGB image by stamping a precomputed disk mask at every center.
+    Disks that are drawn later are drawn on top of earlier disks.
+    The first row of the image is the top (ymax) of the extent.
+
+    Returnvalues:
+    np.ndarray of dtype uint8 with shape (height, width, 3)
+    """
+    xmin, xmax, ymin, ymax = extent
+    width = int(round((xmax - xmin) * pixels_per_unit)) + 1
+    height = int(round((ymax - ymin) * pixels_per_unit)) + 1
+    # Smaller index arrays are faster, flat indices only fit into int32 for images with less than 2**31 pixels
+    index_dtype = np.int32 if width * height < 2 ** 31 else np.int64
+
+    # Draw into an image with one uint32 (r, g, b, 0) per pixel, scattering single values is a lot faster than scattering rgb triples
+    packed_colors = np.zeros((len(colors), 4), dtype=np.uint8)
+    packed_colors[:, :3] = colors
+    packed_colors = packed_colors.view("<u4").ravel()
+    packed_image = np.empty(width * height, dtype="<u4")
+    packed_image[:] = np.array([*background, 0], dtype=np.uint8).view("<u4")[0]
+
+    center_columns = np.round((np.asarray(xs) - xmin) * pixels_per_unit).astype(index_dtype)
+    center_rows = np.round((ymax - np.asarray(ys)) * pixels_per_unit).astype(index_dtype)
+    row_offsets, column_offsets = (offsets.astype(index_dtype) for offsets in disk_stamp(radius * pixels_per_unit))
+
+    stamp_size = len(row_offsets)
+    centers_per_chunk = max(1, PIXEL_BUDGET // stamp_size)
+    for start in range(0, len(center_rows), centers_per_chunk):
+        end = start + centers_per_chunk
+        rows = (center_rows[start:end, None] + row_offsets[None, :]).ravel()
+        columns = (center_columns[start:end, None] + column_offsets[None, :]).ravel()
+        inside = np.flatnonzero((columns >= 0) & (columns < width) & (rows >= 0) & (rows < height))
+        # Pixel i of the chunk belongs to center start + i // stamp_size
+        packed_image[rows[inside] * width + columns[inside]] = packed_colors[start + inside // stamp_size]
+
+    image = np.ascontiguousarray(packed_image.view(np.uint8).reshape(height, width, 4)[:, :, :3])
+    if draw_axes:
+        _draw_axes(image, int(round(ymax * pixels_per_unit)), int(round(-xmin * pixels_per_unit)))
+    return image
+
+
+def render_squares(limit: int, scale: int = 1) -> Optional[np.ndarray]:
+    """
+    Renders generate_2d_ordered_grid_points(limit), the closest points to (0, 0) get the brightest colors.
+
+    Returns None if limit is negative, the generator does not yield any points then.
+    """
+    if limit < 0:
+        return None
+    points = points_to_array(generate_2d_ordered_grid_points(limit), 3, dtype="int64")
+    colors = color_ramp(len(points))
+    brightness = (colors.astype(np.int64) ** 2).sum(axis=1)
+    colors = colors[np.argsort(-brightness, kind="stable")]
+    return render_cells(points[:, 1], points[:, 2], colors, (-limit, limit, -limit, limit), scale=scale)
+
+
+def render_line(start: Tuple[int, int], end: Tuple[int, int], scale: int = 1) -> np.ndarray:
+    """
+    Renders generate_2d_line(*start, *end), colored from the start towards the end of the line.
+    """
+    points = points_to_array(generate_2d_line(*start, *end), 2, dtype="int64")
+    extent = (min(start[0], end[0]), max(start[0], end[0]), min(start[1], end[1]), max(start[1], end[1]))
+    return render_cells(points[:, 0], points[:, 1], color_ramp(len(points)), extent, scale=scale)
+
+
+def render_circles(
+    point_radius: int, limit: int = 100, fill_circle: bool = False, pixels_per_unit: float = 1.0
+) -> Optional[np.ndarray]:
+    """
+    Renders points of generate_2d_circle_points on circles with radius point_radius*2, point_radius*4, ... up to limit.
+    If fill_circle is False, only the outermost circle is rendered.
+    Points on the inner circles get red colors, points on the outer circles get green colors.
+
+    Returns None if no circle fits into the limit.
+    """
+    circle_points = []
+    for circle_radius in range(point_radius * 2, limit, point_radius * 2):
+        if not fill_circle and circle_radius < limit - point_radius * 2:
+            continue
+        circle_points.append(
+            points_to_array(generate_2d_circle_points(point_radius=point_radius, circle_radius=circle_radius), 4)[:, 2:]
+        )
+    if not any(len(points) for points in circle_points):
+        return None
+    if fill_circle:
+        # Draw the center point
+        circle_points.append(np.zeros((1, 2)))
+    positions = np.concatenate(circle_points)
+    xs, ys = positions[:, 0], positions[:, 1]
+
+    # Outer points first, so that the inner points are drawn on top
+    order = np.lexsort((ys, xs, np.round(xs ** 2 + ys ** 2, 3)))[::-1]
+    colors = color_ramp(len(positions))
+    colors = colors[np.lexsort((colors[:, 2], colors[:, 1], colors[:, 0]))]
+
+    extent = (-limit - point_radius, limit + point_radius, -limit - point_radius, limit + point_radius)
+    return render_disks(xs[order], ys[order], point_radius, colors, extent, pixels_per_unit=pixels_per_unit)
+
+
+def save_image(image: np.ndarray, path: str):
+    """
+    Writes the RGB image to a .png file.
+    Needs matplotlib, which is only installed with the "plot" extra (see setup.py).
+    """
+    # Matplotlib is only needed for writing the file, so the rendering functions work without it
+    # matplotlib.image does not need a GUI backend, unlike matplotlib.pyplot
+    try:
+        import matplotlib.image
+    except ModuleNotFoundError as e:
+        raise ImportError('save_image needs matplotlib, install the "plot" extra') from e
+
+    matplotlib.image.imsave(path, image)
+
+
+if __name__ == "__main__":
+    # Run with "python -m generators_2d.visualize" from the repository root
+    import time
+
+    def plot_squares(limit: int):
+        image = render_squares(limit, scale=10)
+        if image is not None:
+            save_image(image, "plot_square.png")
+
+    def plot_line(start: Tuple[int, int], end: Tuple[int, int]):
+        save_image(render_line(start, end, scale=10), "plot_line.png")
+
+    def plot_circles(fill_circle: bool = False):
+        # Set the radius of each point on the circle, and the circle radius
+        limit = 100
+        for point_radius in range(1, 10):
+            image = render_circles(point_radius, limit=limit, fill_circle=fill_circle, pixels_per_unit=4)
+            if image is not None:
+                save_image(image, f"plot_circles-{point_radius:02}-{limit:02}.png")
+
+    t0 = time.perf_counter()
+    plot_squares(limit=5)
+    plot_line(start=(0, 0), end=(40, 30))
+    plot_circles(fill_circle=True)
+    t1 = time.perf_counter()
+    print(t1 - t0)
@@ -20,6 +20,9 @@ setup(
     keywords=["StarCraft", "StarCraft 2", "StarCraft II", "AI", "Bot"],
     setup_requires=["pipenv"],
     install_requires=requirements,
+    # numpy is only needed for the *_array functions, the exporter and the renderer, matplotlib only to write .png files
+    extras_require={"numpy": ["numpy"], "plot": ["numpy", "matplotlib"]},
+    entry_points={"console_scripts": ["generators-2d-export=generators_2d.export:main [numpy]"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
         "Intended Audience :: Developers",
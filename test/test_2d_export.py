@@ -0,0 +1,159 @@
+import sys, os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+import pytest
+from hypothesis import given, settings, strategies as st
+
+from generators_2d.generators import (
+    generate_2d_ordered_grid_points,
+    generate_2d_grid_points,
+    generate_2d_line,
+    generate_2d_circle_points,
+)
+from generators_2d.export import export_points, load_points, main
+
+
+@given(st.integers(min_value=0, max_value=30), st.integers(min_value=1, max_value=100))
+@settings(max_examples=20, deadline=None)
+def test_export_ordered_grid(tmp_path_factory, limit, chunk_size):
+    tmp_path = tmp_path_factory.mktemp("export")
+    expected = list(generate_2d_ordered_grid_points(limit))
+    for file_name in ["points.npy", "points.bin"]:
+        path = str(tmp_path / file_name)
+        count = export_points(path, "ordered_grid", {"limit": limit}, chunk_size=chunk_size)
+        parameters, points = load_points(path)
+
+        assert count == len(expected)
+        assert parameters["kwargs"] == {"limit": limit}
+        assert parameters["count"] == count
+        assert [tuple(row) for row in points.tolist()] == expected
+
+
+def test_export_circle(tmp_path):
+    expected = list(generate_2d_circle_points(point_radius=2, circle_radius=20))
+    path = str(tmp_path / "circle.bin")
+    export_points(path, "circle", {"point_radius": 2, "circle_radius": 20}, chunk_size=7)
+    parameters, points = load_points(path)
+
+    assert parameters["columns"] == ["amount_of_points", "angle", "x", "y"]
+    assert [tuple(row) for row in points.tolist()] == expected
+
+
+def test_export_empty(tmp_path):
+    for file_name in ["empty.npy", "empty.bin"]:
+        path = str(tmp_path / file_name)
+        assert export_points(path, "line", {"x0": 0, "y0": 0, "x1": 0, "y1": 0, "exclude_start": True}) == 0
+        parameters, points = load_points(path)
+        assert points.shape == (0, 2)
+
+
+def test_main(tmp_path):
+    path = str(tmp_path / "line.npy")
+    assert main(["--chunk-size", "3", "line", path, "0", "0", "40", "30", "--exclude-end"]) == 0
+    parameters, points = load_points(path)
+
+    assert parameters["kwargs"]["exclude_end"]
+    assert [tuple(row) for row in points.tolist()] == list(generate_2d_line(0, 0, 40, 30, exclude_end=True))
+
+
+def test_invalid_chunk_size(tmp_path):
+    path = str(tmp_path / "points.npy")
+    for chunk_size in [0, -1]:
+        with pytest.raises(ValueError):
+            export_points(path, "grid", {"max_distance": 2}, chunk_size=chunk_size)
+        with pytest.raises(SystemExit):
+            main(["--chunk-size", str(chunk_size), "grid", path])
+    assert not os.path.exists(path)
+
+
+def test_failed_export_keeps_old_file(tmp_path):
+    for file_name in ["points.npy", "points.bin"]:
+        path = str(tmp_path / file_name)
+        export_points(path, "ordered_grid", {"limit": 2})
+        # Distances up to 200**2 do not fit into int8
+        with pytest.raises(ValueError):
+            export_points(path, "ordered_grid", {"limit": 200}, dtype="int8")
+        parameters, points = load_points(path)
+        assert parameters["kwargs"] == {"limit": 2}
+        assert [tuple(row) for row in points.tolist()] == list(generate_2d_ordered_grid_points(2))
+    assert sorted(os.listdir(str(tmp_path))) == ["points.bin", "points.npy", "points.npy.json"]
+
+
+def test_load_npy_without_sidecar(tmp_path):
+    path = str(tmp_path / "points.npy")
+    export_points(path, "grid", {"max_distance": 3})
+    os.remove(path + ".json")
+    parameters, points = load_points(path)
+
+    assert isinstance(points, np.memmap)
+    assert parameters == {"count": 49, "dtype": "<i8"}
+    assert [tuple(row) for row in points.tolist()] == list(generate_2d_grid_points(max_distance=3))
+
+    path = str(tmp_path / "empty.npy")
+    np.save(path, np.empty((0, 2), dtype=np.float32))
+    parameters, points = load_points(path)
+    assert parameters == {"count": 0, "dtype": "<f4"}
+    assert points.shape == (0, 2)
+
+
+def test_export_dtype(tmp_path):
+    path = str(tmp_path / "points.bin")
+    # Smaller dtypes are fine as long as all values fit
+    export_points(path, "ordered_grid", {"limit": 5}, dtype="int8")
+    parameters, points = load_points(path)
+    assert points.dtype == np.int8
+    assert [tuple(row) for row in points.tolist()] == list(generate_2d_ordered_grid_points(5))
+
+    # Floats may be rounded to a smaller float dtype
+    export_points(path, "circle", {"point_radius": 1, "circle_radius": 10}, dtype="float32")
+    parameters, points = load_points(path)
+    expected = np.array(list(generate_2d_circle_points(1, 10)), dtype=np.float32)
+    assert (points == expected).all()
+
+    # Floats would be truncated, coordinates would wrap around
+    with pytest.raises(ValueError):
+        export_points(path, "circle", {"point_radius": 1, "circle_radius": 10}, dtype="int32")
+    with pytest.raises(ValueError):
+        export_points(path, "line", {"x0": 2 ** 31 - 2, "y0": 0, "x1": 2 ** 31 + 2, "y1": 0}, dtype="int32")
+    with pytest.raises(ValueError):
+        export_points(path, "grid", {"min_distance": 128, "max_distance": 128}, dtype="int8")
+
+
+def test_export_permissions(tmp_path):
+    path = str(tmp_path / "points.npy")
+    export_points(path, "grid", {})
+    reference = str(tmp_path / "reference")
+    open(reference, "w").close()
+    assert os.stat(path).st_mode == os.stat(reference).st_mode
+    assert os.stat(path + ".json").st_mode == os.stat(reference).st_mode
+
+
+def test_failed_sidecar_replace(tmp_path, monkeypatch):
+    path = str(tmp_path / "points.npy")
+    replace = os.replace
+
+    def fail_for_sidecar(source, target):
+        if target.endswith(".json"):
+            raise OSError("sidecar can not be replaced")
+        replace(source, target)
+
+    monkeypatch.setattr(os, "replace", fail_for_sidecar)
+    with pytest.raises(OSError):
+        export_points(path, "grid", {"max_distance": 2})
+    # No temporary files are left behind
+    assert os.listdir(str(tmp_path)) == ["points.npy"]
+
+
+def test_load_npy_with_outdated_sidecar(tmp_path):
+    path = str(tmp_path / "points.npy")
+    export_points(path, "grid", {"max_distance": 3})
+    sidecar = open(path + ".json").read()
+    export_points(path, "grid", {"max_distance": 1})
+    # A reader may see the new data file before the new sidecar replaced the old one
+    with open(path + ".json", "w") as f:
+        f.write(sidecar)
+    parameters, points = load_points(path)
+    assert parameters == {"count": 9, "dtype": "<i8"}
+    assert points.shape == (9, 2)
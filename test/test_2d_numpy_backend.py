@@ -0,0 +1,104 @@
+import sys, os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import subprocess
+
+import numpy as np
+import pytest
+from hypothesis import given, settings, strategies as st
+
+import generators_2d
+from generators_2d.generators import (
+    generate_2d_ordered_grid_points,
+    generate_2d_grid_points,
+    generate_2d_line,
+    generate_2d_circle_points,
+)
+from generators_2d.numpy_backend import (
+    generate_2d_ordered_grid_points_array,
+    generate_2d_grid_points_array,
+    generate_2d_line_array,
+    generate_2d_circle_points_array,
+)
+
+
+@given(st.integers(min_value=0, max_value=100))
+@settings(max_examples=20)
+def test_ordered_grid_points_array(limit):
+    expected = list(generate_2d_ordered_grid_points(limit))
+    assert [tuple(row) for row in generate_2d_ordered_grid_points_array(limit).tolist()] == expected
+
+
+@given(st.integers(min_value=0, max_value=50), st.integers(min_value=0, max_value=50), st.integers(min_value=1, max_value=5))
+def test_grid_points_array(min_distance, max_distance, step_size):
+    expected = list(generate_2d_grid_points(min_distance, max_distance, step_size))
+    result = generate_2d_grid_points_array(min_distance, max_distance, step_size)
+    assert [tuple(row) for row in result.tolist()] == expected
+
+
+@given(
+    st.integers(min_value=-10 ** 5, max_value=10 ** 5),
+    st.integers(min_value=-10 ** 5, max_value=10 ** 5),
+    st.integers(min_value=-10 ** 3, max_value=10 ** 3),
+    st.integers(min_value=-10 ** 3, max_value=10 ** 3),
+    st.booleans(),
+    st.booleans(),
+)
+def test_line_array(x0, y0, east, north, exclude_start, exclude_end):
+    x1, y1 = x0 + east, y0 + north
+    expected = list(generate_2d_line(x0, y0, x1, y1, exclude_start, exclude_end))
+    result = generate_2d_line_array(x0, y0, x1, y1, exclude_start, exclude_end)
+    assert [tuple(row) for row in result.tolist()] == expected
+
+
+@given(st.integers(min_value=1, max_value=10 ** 3), st.integers(min_value=2, max_value=10 ** 3))
+def test_circle_points_array(point_radius, circle_radius):
+    expected = np.array(list(generate_2d_circle_points(point_radius, circle_radius)), dtype=np.float64).reshape(-1, 4)
+    result = generate_2d_circle_points_array(point_radius, circle_radius)
+    assert result.shape == expected.shape
+    assert (result[:, :2] == expected[:, :2]).all()
+    assert np.allclose(result[:, 2:], expected[:, 2:], rtol=0, atol=1e-9)
+
+
+def test_backends():
+    assert generators_2d.get_backend("generate_2d_line") == "python"
+    assert generators_2d.get_backend(generators_2d.generate_2d_line_array) == "numpy"
+    assert generators_2d.generate_2d_line_array is generate_2d_line_array
+    for name, backends in generators_2d.BACKENDS.items():
+        assert generators_2d.get_generator(name) is getattr(generators_2d, name)
+        assert generators_2d.get_generator(name, "numpy").__name__ == f"{name}_array"
+    # Helper functions are not backend variants of a generator
+    with pytest.raises(ValueError):
+        generators_2d.get_backend("export_points")
+    with pytest.raises(ValueError):
+        generators_2d.get_generator("generate_2d_line", "numba")
+    assert generators_2d.DEPENDENCIES["save_image"] == ("numpy", "matplotlib")
+    for name in generators_2d.__all__:
+        assert hasattr(generators_2d, name)
+    assert [name for name in dir(generators_2d) if not name.startswith("__")] == sorted(generators_2d.__all__)
+
+
+def test_import_does_not_load_numpy():
+    code = (
+        "import sys, generators_2d; "
+        "assert 'numpy' not in sys.modules; "
+        "generators_2d.generate_2d_grid_points_array; "
+        "assert 'numpy' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.join(os.path.dirname(__file__), ".."))
+
+
+def test_missing_numpy():
+    # Setting sys.modules["numpy"] to None makes every import of numpy fail, like in an install without the extra
+    code = (
+        "import sys; sys.modules['numpy'] = None; import generators_2d\n"
+        "assert list(generators_2d.get_generator('generate_2d_line')(0, 0, 1, 0)) == [(0, 0), (1, 0)]\n"
+        "try:\n"
+        "    generators_2d.get_generator('generate_2d_line', 'numpy')\n"
+        "except ImportError as e:\n"
+        "    assert type(e) is ImportError and '\"numpy\" extra' in str(e), e\n"
+        "else:\n"
+        "    raise AssertionError('no ImportError')\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.join(os.path.dirname(__file__), ".."))
@@ -0,0 +1,123 @@
+import sys, os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import tracemalloc
+
+import numpy as np
+from hypothesis import given, settings, strategies as st
+
+from generators_2d.generators import _get_colors_hex, generate_2d_line
+from generators_2d import visualize
+from generators_2d.visualize import (
+    color_ramp,
+    disk_stamp,
+    render_cells,
+    render_disks,
+    render_line,
+    render_squares,
+    save_image,
+)
+
+
+@given(st.integers(min_value=1, max_value=10 ** 4))
+@settings(max_examples=20)
+def test_color_ramp(amount):
+    expected = [color for color, _ in zip(_get_colors_hex(amount), range(amount))]
+    assert [tuple(color) for color in color_ramp(amount).tolist()] == expected
+
+
+def test_render_cells():
+    colors = np.array([[1, 2, 3], [4, 5, 6]], dtype=np.uint8)
+    image = render_cells(np.array([-1, 2]), np.array([1, -1]), colors, (-1, 2, -1, 1), draw_axes=False)
+
+    assert image.shape == (3, 4, 3)
+    # The top left pixel is (xmin, ymax)
+    assert image[0, 0].tolist() == [1, 2, 3]
+    assert image[2, 3].tolist() == [4, 5, 6]
+    assert (image != 255).any(axis=2).sum() == 2
+
+    scaled = render_cells(np.array([-1, 2]), np.array([1, -1]), colors, (-1, 2, -1, 1), scale=3, draw_axes=False)
+    assert scaled.shape == (9, 12, 3)
+    assert (scaled[:3, :3] == [1, 2, 3]).all()
+
+
+def test_render_line():
+    image = render_line((0, 0), (40, 30))
+    for x, y in generate_2d_line(0, 0, 40, 30):
+        assert image[30 - y, x].tolist() != [255, 255, 255]
+
+
+def test_render_squares():
+    image = render_squares(limit=5)
+    assert image.shape == (11, 11, 3)
+    # Axes are drawn through (0, 0)
+    assert (image[5] == 0).all()
+    assert (image[:, 5] == 0).all()
+
+    assert render_squares(limit=-1) is None
+
+
+def test_render_disks():
+    row_offsets, column_offsets = disk_stamp(2)
+    assert len(row_offsets) == 13
+
+    colors = np.array([[10, 20, 30]], dtype=np.uint8)
+    image = render_disks(np.array([0.0]), np.array([0.0]), 2, colors, (-5, 5, -5, 5), pixels_per_unit=2, draw_axes=False)
+
+    assert image.shape == (21, 21, 3)
+    colored = (image == [10, 20, 30]).all(axis=2)
+    # A disk with radius of 4 pixels
+    assert colored.sum() == len(disk_stamp(4)[0])
+    assert colored[10, 10] and colored[6, 10] and not colored[5, 10]
+
+
+def test_render_disks_chunks(monkeypatch):
+    # Draw the disks one after another without chunking, later disks overwrite earlier disks
+    rng = np.random.default_rng(0)
+    xs, ys = rng.uniform(-10, 10, 50), rng.uniform(-10, 10, 50)
+    colors = color_ramp(50)
+    row_offsets, column_offsets = disk_stamp(3 * 2)
+    expected = np.full((41, 41, 3), 255, dtype=np.uint8)
+    for x, y, color in zip(xs, ys, colors):
+        rows = np.round((10 - y) * 2).astype(int) + row_offsets
+        columns = np.round((x + 10) * 2).astype(int) + column_offsets
+        inside = (rows >= 0) & (rows < 41) & (columns >= 0) & (columns < 41)
+        expected[rows[inside], columns[inside]] = color
+
+    # Chunks of 2 disks, and of less than a single disk
+    for pixel_budget in [len(row_offsets) * 2, 10]:
+        monkeypatch.setattr(visualize, "PIXEL_BUDGET", pixel_budget)
+        image = render_disks(xs, ys, 3, colors, (-10, 10, -10, 10), pixels_per_unit=2, draw_axes=False)
+        assert (image == expected).all()
+
+
+def test_render_disks_memory():
+    # Large disks, like plot_circles with point_radius=9, must not allocate temporary arrays per stamp pixel of all disks at once
+    rng = np.random.default_rng(0)
+    amount = 2000
+    xs, ys = rng.uniform(-100, 100, amount), rng.uniform(-100, 100, amount)
+    colors = color_ramp(amount)
+
+    tracemalloc.start()
+    try:
+        image = render_disks(xs, ys, 9, colors, (-109, 109, -109, 109), pixels_per_unit=4)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert image.shape == (873, 873, 3)
+    # The image itself is about 2.3 MB
+    assert peak < 32 * 10 ** 6
+
+
+def test_save_image(tmp_path):
+    import matplotlib.image
+
+    image = render_squares(limit=5, scale=2)
+    path = str(tmp_path / "squares.png")
+    save_image(image, path)
+    # Reading back returns rgba floats in the range [0, 1]
+    saved = matplotlib.image.imread(path)
+    assert (np.round(saved[:, :, :3] * 255).astype(np.uint8) == image).all()
+    assert "matplotlib.pyplot" not in sys.modules